@@ -1,41 +1,164 @@
 from typing import List, Optional
+import logging
 import random
 
+logger = logging.getLogger(__name__)
+
+# Bitboard constants: cell i of the board is bit i (bit 0 = position 1).
+# Each of the 8 winning lines is a 9-bit mask.
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows
+    0b001001001, 0b010010010, 0b100100100,  # Columns
+    0b100010001, 0b001010100                # Diagonals
+)
+FULL_BOARD = 0x1FF
+
+# Static move ordering for the search: center first, then corners, then
+# edges. Trying the strongest squares first makes alpha-beta cut earlier.
+_ORDERED_BITS = tuple(1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+# Index triples for the list-board form of the same 8 lines
+_WIN_COMBOS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6)              # Diagonals
+)
+
+def _build_symmetries():
+    """Build the 8 cell permutations of the board's D4 symmetry group
+    (4 rotations x optional reflection), then expand each into a
+    512-entry bitboard lookup table."""
+    def rot90(i):
+        r, c = divmod(i, 3)
+        return c * 3 + (2 - r)
+
+    def mirror(i):
+        r, c = divmod(i, 3)
+        return r * 3 + (2 - c)
+
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(mirror(i) for i in perm))
+        perm = tuple(rot90(i) for i in perm)
+
+    tables = []
+    for perm in perms:
+        table = [0] * 512
+        for bb in range(512):
+            out = 0
+            for i in range(9):
+                if bb >> i & 1:
+                    out |= 1 << perm[i]
+            table[bb] = out
+        tables.append(tuple(table))
+    return tuple(perms), tuple(tables)
+
+SYM_PERMS, _SYM_TABLES = _build_symmetries()
+
+def _canonical(ai_bb: int, opp_bb: int) -> tuple:
+    """Smallest (ai_bb, opp_bb) pair over all 8 board symmetries."""
+    return min((table[ai_bb], table[opp_bb]) for table in _SYM_TABLES)
+
+# Transposition-table entry flags: is the stored score exact, or only a
+# bound produced by an alpha-beta cutoff?
+_TT_EXACT = 0
+_TT_LOWER = 1
+_TT_UPPER = 2
+
+def _to_bb(board: List[Optional[str]], player: str) -> int:
+    """Pack the cells occupied by `player` into a 9-bit integer."""
+    bb = 0
+    for i, cell in enumerate(board):
+        if cell == player:
+            bb |= 1 << i
+    return bb
+
+def _has_won(bb: int) -> bool:
+    """True if the bitboard contains any complete winning line."""
+    for mask in WIN_MASKS:
+        if (bb & mask) == mask:
+            return True
+    return False
+
 class TicTacToeAgent:
+    # Perfect-play policy table shared by all agent instances:
+    # (to_move_bb, other_bb) -> best move index. Tic-tac-toe has ~5.5k
+    # reachable positions, so the whole game solves in well under a
+    # second and best_move becomes a dict lookup afterwards.
+    _policy: dict = {}
+
     def __init__(self):
-        pass
+        # Transposition table: (ai_bb, opp_bb, is_maximizing) -> (score, flag).
+        # Positions reached through different move orders hit the same entry,
+        # so repeated searches collapse into dict lookups.
+        self._tt: dict = {}
 
     def new_game(self) -> int:
-        print("MCP-TicTacToeAgent: new_game")
+        logger.debug("new_game")
         return 1
 
     def best_move(self, board: List[Optional[str]], player: str, game_over: bool = False, winner: Optional[str] = None) -> int:
-        print("MCP-TicTacToeAgent: best_move", player, board)
+        logger.debug("best_move %s %s", player, board)
         if game_over: return -1
 
-        valid_moves = [i for i, cell in enumerate(board) if cell is None]
-        if not valid_moves: return -1
+        opponent = 'X' if player == 'O' else 'O'
+        ai_bb = _to_bb(board, player)
+        opp_bb = _to_bb(board, opponent)
+        empties = ~(ai_bb | opp_bb) & FULL_BOARD
+        if not empties: return -1
+
+        # One-ply shortcut: take an immediate win, else block the
+        # opponent's immediate win, without descending into minimax
+        for bb in (ai_bb, opp_bb):
+            moves = empties
+            while moves:
+                bit = moves & -moves
+                moves ^= bit
+                if _has_won(bb | bit):
+                    return bit.bit_length()  # bit i -> position i+1
+
+        # Perfect-play policy: built once on first use, then every
+        # reachable position is a single dict lookup
+        if not TicTacToeAgent._policy:
+            self._build_policy()
+        move = TicTacToeAgent._policy.get((ai_bb, opp_bb))
+        if move is not None:
+            return move + 1
 
+        # Fallback search for positions outside a normal game (e.g. boards
+        # handed to the tool with an impossible mark count)
         best_score = float('-inf')
-        best_move_idx = valid_moves[0]
-        
-        for move in valid_moves:
-            # Make the move
-            board_copy = board.copy()
-            board_copy[move] = player
-            
-            # Get the score for this move
-            score = self._minimax(board_copy, False, player)
-            
+        best_move_idx = (empties & -empties).bit_length() - 1
+
+        seen = set()
+        for bit in _ORDERED_BITS:
+            if not (empties & bit):
+                continue
+
+            # Skip moves whose resulting position is a rotation/reflection
+            # of one already evaluated (3 distinct root moves instead of 9
+            # on an empty board)
+            child = _canonical(ai_bb | bit, opp_bb)
+            if child in seen:
+                continue
+            seen.add(child)
+
+            # Make the move on the AI's bitboard and score the child;
+            # passing the best score so far as alpha lets root-level
+            # cutoffs fire too
+            score = self._minimax(ai_bb | bit, opp_bb, False, best_score, float('inf'))
+
             # If this move is better, save it
             if score > best_score:
                 best_score = score
-                best_move_idx = move
-        
+                best_move_idx = bit.bit_length() - 1
+
         return best_move_idx + 1  # Convert to 1-based indexing
 
     def random_move(self, board: List[Optional[str]], player: str, game_over: bool = False, winner: Optional[str] = None) -> int:
-        print("MCP-TicTacToeAgent: random_move", player, board)
+        logger.debug("random_move %s %s", player, board)
         if game_over: return -1
 
         valid_moves = [i for i, cell in enumerate(board) if cell is None]
@@ -44,50 +167,114 @@ class TicTacToeAgent:
         return random.choice(valid_moves) + 1  # Convert to 1-based indexing
 
     def play_move(self, board: List[Optional[str]], position: int, player: str) -> int:
-        print("MCP-TicTacToeAgent: play_move", player, board)
+        logger.debug("play_move %s %s", player, board)
         if position < 1 or position > 9: return -1
         if board[position - 1] is not None: return -1
         return position
 
-    def _minimax(self, board: List[Optional[str]], is_maximizing: bool, ai_player: str) -> int:
-        winner = self._check_winner(board)
-        
-        # Terminal states
-        if winner == ai_player:  return 1  # Win
-        elif winner is not None: return -1 # Loss
-        elif None not in board:  return 0  # Tie
-        
-        opponent = 'X' if ai_player == 'O' else 'O'
-        
+    def _build_policy(self):
+        """Solve every position reachable in a legal game and record the
+        best move for the side to move."""
+        policy = {}
+
+        def visit(own_bb: int, opp_bb: int):
+            if (own_bb, opp_bb) in policy:
+                return
+            if _has_won(own_bb) or _has_won(opp_bb):
+                return
+            empties = ~(own_bb | opp_bb) & FULL_BOARD
+            if not empties:
+                return
+
+            best_score = float('-inf')
+            best_bit = empties & -empties
+            for bit in _ORDERED_BITS:
+                if not (empties & bit):
+                    continue
+                score = self._minimax(own_bb | bit, opp_bb, False, best_score, float('inf'))
+                if score > best_score:
+                    best_score = score
+                    best_bit = bit
+            policy[(own_bb, opp_bb)] = best_bit.bit_length() - 1
+
+            # Recurse into every legal reply, not just the best one, so the
+            # table covers whatever the opponent actually plays
+            moves = empties
+            while moves:
+                bit = moves & -moves
+                moves ^= bit
+                visit(opp_bb, own_bb | bit)
+
+        visit(0, 0)
+        TicTacToeAgent._policy = policy
+
+    def _minimax(self, ai_bb: int, opp_bb: int, is_maximizing: bool,
+                 alpha: float = float('-inf'), beta: float = float('inf')) -> int:
+        # Terminal states: the side that just moved may have completed a
+        # line. Scores shrink with the number of marks on the board, so a
+        # win in fewer moves outranks a slower one (and a slow loss beats a
+        # fast one). The mark count is a property of the position itself,
+        # which keeps the scores valid in the transposition table.
+        marks = (ai_bb | opp_bb).bit_count()
+        if _has_won(ai_bb):  return 10 - marks   # Win
+        if _has_won(opp_bb): return marks - 10   # Loss
+        empties = ~(ai_bb | opp_bb) & FULL_BOARD
+        if not empties:      return 0            # Tie
+
+        # Transposition table keyed by the canonical symmetry of the position,
+        # so all 8 rotations/reflections share one entry. Bound flags left
+        # behind by alpha-beta cutoffs are honoured on reuse
+        key = (_canonical(ai_bb, opp_bb), is_maximizing)
+        entry = self._tt.get(key)
+        if entry is not None:
+            score, flag = entry
+            if (flag == _TT_EXACT
+                    or (flag == _TT_LOWER and score >= beta)
+                    or (flag == _TT_UPPER and score <= alpha)):
+                return score
+
+        alpha_orig = alpha
+        beta_orig = beta
+
         if is_maximizing:
             best_score = float('-inf')
-            for i in range(9):
-                if board[i] is None:
-                    board[i] = ai_player
-                    score = self._minimax(board, False, ai_player)
-                    board[i] = None
-                    best_score = max(score, best_score)
-            return best_score
+            for bit in _ORDERED_BITS:
+                if not (empties & bit):
+                    continue
+                score = self._minimax(ai_bb | bit, opp_bb, False, alpha, beta)
+                best_score = max(score, best_score)
+                # Alpha-beta pruning: stop once this branch can't matter
+                alpha = max(alpha, best_score)
+                if beta <= alpha:
+                    break
         else:
             best_score = float('inf')
-            for i in range(9):
-                if board[i] is None:
-                    board[i] = opponent
-                    score = self._minimax(board, True, ai_player)
-                    board[i] = None
-                    best_score = min(score, best_score)
-            return best_score
+            for bit in _ORDERED_BITS:
+                if not (empties & bit):
+                    continue
+                score = self._minimax(ai_bb, opp_bb | bit, True, alpha, beta)
+                best_score = min(score, best_score)
+                # Alpha-beta pruning: stop once this branch can't matter
+                beta = min(beta, best_score)
+                if beta <= alpha:
+                    break
+
+        # Store the result with the appropriate bound flag, classified
+        # against the window as it was on entry — the loops above narrow
+        # alpha/beta, so comparing against the mutated locals would misfile
+        # exact scores as bounds
+        if best_score <= alpha_orig:
+            flag = _TT_UPPER
+        elif best_score >= beta_orig:
+            flag = _TT_LOWER
+        else:
+            flag = _TT_EXACT
+        self._tt[key] = (best_score, flag)
+        return best_score
 
     def _check_winner(self, board: List[Optional[str]]) -> Optional[str]:
-        winning_combinations = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]              # Diagonals
-        ]
-        
-        for combo in winning_combinations:
-            if (board[combo[0]] is not None and 
-                board[combo[0]] == board[combo[1]] == board[combo[2]]):
-                return board[combo[0]]
-        
+        for a, b, c in _WIN_COMBOS:
+            if board[a] is not None and board[a] == board[b] == board[c]:
+                return board[a]
+
         return None
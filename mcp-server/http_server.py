@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
-import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, Dict
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+import orjson
 from pydantic import BaseModel
-import uvicorn
 
 from mcp_tools import MCPTools
 import config
@@ -20,67 +23,42 @@ class CallToolRequest(BaseModel):
     name: str
     arguments: Dict[str, Any]
 
-class CallToolResponse(BaseModel):
-    content: List[Dict[str, Any]]
-    isError: bool = False
-
 class MCPClient:
-    """Client to communicate with the MCP server process."""
-    
+    """In-process wrapper around the MCP tool implementations."""
+
     def __init__(self):
-        self.process = None
         self.mcp_tools = MCPTools()
-    
-    async def start_mcp_server(self):
-        """Start the MCP server process."""
-        try:
-            import os
-            server_dir = os.path.dirname(os.path.abspath(__file__))
-            self.process = await asyncio.create_subprocess_exec(
-                'python', 'server.py',
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=server_dir
-            )
-            logger.info("MCP server process started")
-        except Exception as e:
-            logger.error(f"Failed to start MCP server: {e}")
-            raise
-    
-    async def stop_mcp_server(self):
-        """Stop the MCP server process."""
-        if self.process:
-            self.process.terminate()
-            await self.process.wait()
-            logger.info("MCP server process stopped")
-    
-    def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available MCP tools."""
-        tools = self.mcp_tools.get_tools()
-        # Convert Tool objects to dictionaries for JSON serialization
-        return [
+        # Tools and resources are static over the process lifetime, so
+        # build their JSON-serializable forms once instead of per request.
+        # Tuples rather than lists: the caches are handed out by reference,
+        # and freezing them keeps a caller from mutating shared state
+        self._tools_json = tuple(
             {
                 "name": tool.name,
                 "description": tool.description,
                 "inputSchema": tool.inputSchema
             }
-            for tool in tools
-        ]
-    
-    def get_available_resources(self) -> List[Dict[str, Any]]:
-        """Get list of available MCP resources."""
-        resources = self.mcp_tools.get_resources()
-        # Convert Resource objects to dictionaries for JSON serialization
-        return [
+            for tool in self.mcp_tools.get_tools()
+        )
+        self._resources_json = tuple(
             {
-                "uri": resource.uri,
+                # Resource.uri is a pydantic AnyUrl; orjson only knows how
+                # to encode it as a plain string
+                "uri": str(resource.uri),
                 "name": resource.name,
                 "description": resource.description,
                 "mimeType": resource.mimeType
             }
-            for resource in resources
-        ]
+            for resource in self.mcp_tools.get_resources()
+        )
+
+    def get_available_tools(self) -> tuple:
+        """Get the static tuple of available MCP tools."""
+        return self._tools_json
+
+    def get_available_resources(self) -> tuple:
+        """Get the static tuple of available MCP resources."""
+        return self._resources_json
     
     async def call_mcp_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call an MCP tool through the MCPTools interface."""
@@ -88,21 +66,23 @@ class MCPClient:
             # Use MCPTools to execute the tool
             result = await self.mcp_tools.execute_tool(tool_name, arguments)
             
-            # Convert CallToolResult to the expected format
-            content_list = []
-            for content_item in result.content:
-                if hasattr(content_item, 'text'):
-                    content_list.append({"type": "text", "text": content_item.text})
-                else:
-                    content_list.append({"type": "text", "text": str(content_item)})
+            # Convert CallToolResult to the expected format; getattr with a
+            # default avoids the try/except machinery hasattr runs per item,
+            # and the comprehension skips the per-item append method lookup
+            content_list = [
+                {"type": "text", "text": text if (text := getattr(content_item, 'text', None)) is not None else str(content_item)}
+                for content_item in result.content
+            ]
             
+            # CallToolResult always defines isError (default False), so read
+            # it directly instead of probing with getattr
             return {
                 "content": content_list,
-                "isError": getattr(result, 'isError', False)
+                "isError": result.isError
             }
             
         except Exception as e:
-            logger.error(f"Error calling MCP tool {tool_name}: {e}")
+            logger.error("Error calling MCP tool %s: %s", tool_name, e)
             return {
                 "content": [{"type": "text", "text": f"Error: {str(e)}"}],
                 "isError": True
@@ -115,32 +95,47 @@ class MCPClient:
             content = await self.mcp_tools.get_resource_content(resource_uri)
             return content
         except Exception as e:
-            logger.error(f"Error reading resource {resource_uri}: {e}")
+            logger.error("Error reading resource %s: %s", resource_uri, e)
             raise
 
 # Global MCP client
 mcp_client = MCPClient()
 
+# The listing payloads are static after startup, so serialize them once
+# and serve the cached bytes from the handlers
+_TOOLS_JSON = orjson.dumps({"tools": mcp_client.get_available_tools()})
+_RESOURCES_JSON = orjson.dumps({"resources": mcp_client.get_available_resources()})
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a pre-serialized response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+_TOOLS_ETAG = _etag(_TOOLS_JSON)
+_RESOURCES_ETAG = _etag(_RESOURCES_JSON)
+
+def _cached_json(request: Request, body: bytes, etag: str) -> Response:
+    """Serve static JSON bytes, answering 304 on an ETag match so repeat
+    clients skip the payload entirely."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json",
+                    headers={"Cache-Control": "public, max-age=30", "ETag": etag})
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage the lifecycle of the FastAPI app."""
-    # Startup
-    try:
-        await mcp_client.start_mcp_server()
-    except Exception as e:
-        logger.warning(f"Could not start MCP server process: {e}. Using direct AI agent calls.")
-    
+    # Startup: warm the AI agent so the first best_move request doesn't
+    # pay for building the policy table
+    mcp_client.mcp_tools.agent.best_move([None] * 9, "X")
     yield
-    
-    # Shutdown
-    await mcp_client.stop_mcp_server()
 
 # Create FastAPI app
 app = FastAPI(
     title="ChatTTT MCP HTTP Server",
     description="HTTP server that interfaces with the MCP server for ChatTTT game",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -152,117 +147,122 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress text-heavy bodies (resource reads, tool-call content); the
+# threshold keeps small JSON responses uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# With the MCP tools running in-process the health payload is constant,
+# so it is serialized once at import time
+_HEALTH_JSON = orjson.dumps({
+    "status": "healthy",
+    "service": "chattt-mcp-http-server",
+    "mcp_server_available": True
+})
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "chattt-mcp-http-server",
-        "mcp_server_available": mcp_client.process is not None and mcp_client.process.returncode is None
+    return Response(_HEALTH_JSON, media_type="application/json",
+                    headers={"Cache-Control": "public, max-age=5"})
+
+# /info reflects build-time constants, so it is serialized once as well
+_INFO_JSON = orjson.dumps({
+    "name": "chattt-mcp-server",
+    "version": "1.0.0",
+    "description": "MCP server for ChatTTT game with AI strategy",
+    "capabilities": {
+        "tools": True,
+        "resources": True,
+        "prompts": False
+    },
+    "protocol_version": "1.0",
+    "server_info": {
+        "name": "chattt-mcp-server",
+        "version": "1.0.0"
     }
+})
 
 @app.get("/info")
 async def get_server_info():
     """Get server information - required for MCP discovery."""
-    return {
-        "name": "chattt-mcp-server",
-        "version": "1.0.0",
-        "description": "MCP server for ChatTTT game with AI strategy",
-        "capabilities": {
-            "tools": True,
-            "resources": True,
-            "prompts": False
-        },
-        "protocol_version": "1.0",
-        "server_info": {
-            "name": "chattt-mcp-server",
-            "version": "1.0.0"
-        }
-    }
+    return Response(_INFO_JSON, media_type="application/json",
+                    headers={"Cache-Control": "public, max-age=3600"})
 
 @app.get("/tools")
-async def get_tools():
+async def get_tools(request: Request):
     """Get available MCP tools."""
-    try:
-        tools = mcp_client.get_available_tools()
-        return {
-            "tools": tools
-        }
-    except Exception as e:
-        logger.error(f"Error getting tools: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return _cached_json(request, _TOOLS_JSON, _TOOLS_ETAG)
 
 @app.get("/resources")
-async def get_resources():
+async def get_resources(request: Request):
     """Get available MCP resources."""
-    try:
-        resources = mcp_client.get_available_resources()
-        return {
-            "resources": resources
-        }
-    except Exception as e:
-        logger.error(f"Error getting resources: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return _cached_json(request, _RESOURCES_JSON, _RESOURCES_ETAG)
 
 @app.get("/api/resources")
-async def get_api_resources():
+async def get_api_resources(request: Request):
     """Get available MCP resources (API endpoint)."""
-    try:
-        resources = mcp_client.get_available_resources()
-        return {
-            "resources": resources
-        }
-    except Exception as e:
-        logger.error(f"Error getting resources: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return _cached_json(request, _RESOURCES_JSON, _RESOURCES_ETAG)
 
 @app.get("/resources/{resource_uri:path}")
-async def read_resource(resource_uri: str):
-    """Read the content of a specific resource."""
+async def read_resource(resource_uri: str, raw: bool = False):
+    """Read the content of a specific resource.
+
+    With ?raw=1 the body is returned as plain text, skipping the JSON
+    envelope and the escape pass over the whole document."""
     try:
         content = await mcp_client.read_resource_content(resource_uri)
+        if raw:
+            return PlainTextResponse(content)
         return {
             "content": content
         }
     except Exception as e:
-        logger.error(f"Error reading resource {resource_uri}: {e}")
+        logger.error("Error reading resource %s: %s", resource_uri, e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/api/resources/{resource_uri:path}")
-async def read_api_resource(resource_uri: str):
+async def read_api_resource(resource_uri: str, raw: bool = False):
     """Read the content of a specific resource (API endpoint)."""
     try:
         content = await mcp_client.read_resource_content(resource_uri)
+        if raw:
+            return PlainTextResponse(content)
         return {
             "content": content
         }
     except Exception as e:
-        logger.error(f"Error reading resource {resource_uri}: {e}")
+        logger.error("Error reading resource %s: %s", resource_uri, e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.post("/call-tool", response_model=CallToolResponse)
+@app.post("/call-tool")
 async def call_tool_endpoint(request: CallToolRequest):
     """Generic endpoint to call any MCP tool."""
-    try:
-        result = await mcp_client.call_mcp_tool(request.name, request.arguments)
-        
-        return CallToolResponse(
-            content=result["content"],
-            isError=result.get("isError", False)
-        )
-        
-    except Exception as e:
-        logger.error(f"Error in call-tool endpoint: {e}")
-        return CallToolResponse(
-            content=[{"type": "text", "text": f"Error calling tool {request.name}: {str(e)}"}],
-            isError=True
-        )
+    # call_mcp_tool already returns the final response shape (and maps
+    # failures onto an isError payload). Building the ORJSONResponse here
+    # hands the dict straight to orjson in one pass, skipping FastAPI's
+    # jsonable_encoder walk over every content item
+    return ORJSONResponse(await mcp_client.call_mcp_tool(request.name, request.arguments))
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "http_server:app",
-        host=config.HOST,
-        port=config.PORT,
-        reload=True,
-        log_level="info"
-    )
+    import uvicorn
+
+    if os.getenv("CHATTT_DEV") == "1":
+        # Development: auto-reload, default asyncio loop
+        uvicorn.run(
+            "http_server:app",
+            host=config.HOST,
+            port=config.PORT,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # Production: libuv event loop, C HTTP parser, one worker per core
+        uvicorn.run(
+            "http_server:app",
+            host=config.HOST,
+            port=config.PORT,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+            log_level="info"
+        )
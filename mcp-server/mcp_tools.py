@@ -2,156 +2,10 @@ from typing import Any, Dict, List, Optional
 from mcp.types import Tool, TextContent, CallToolResult, Resource
 from agent import TicTacToeAgent
 
-class MCPTools:
-    def __init__(self):
-        self.agent = TicTacToeAgent()
-    
-    def get_tools(self) -> List[Tool]:
-        """Return list of available MCP tools."""
-        return [
-            Tool(
-                name="new_game",
-                description="Clear the board and start a new game.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="best_move",
-                description="Get the best move for a given board state",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "board": {
-                            "type": "array",
-                            "items": {
-                                "type": ["string", "null"]
-                            },
-                            "minItems": 9,
-                            "maxItems": 9,
-                            "description": "Array representing the board state"
-                        },
-                        "player": {
-                            "type": "string",
-                            "description": "Player to get move for (X or O)",
-                            "enum": ["X", "O"]
-                        },
-                        "game_over": {
-                            "type": "boolean",
-                            "description": "Whether the game has ended",
-                            "default": False
-                        },
-                        "winner": {
-                            "type": ["string", "null"],
-                            "description": "The winner of the game (X, O, or null for tie/ongoing)",
-                            "enum": ["X", "O", None]
-                        }
-                    },
-                    "required": ["board", "player"]
-                }
-            ),
-            Tool(
-                name="random_move",
-                description="Get a random move",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "board": {
-                            "type": "array",
-                            "items": {
-                                "type": ["string", "null"]
-                            },
-                            "minItems": 9,
-                            "maxItems": 9,
-                            "description": "Array representing the board state"
-                        },
-                        "player": {
-                            "type": "string",
-                            "description": "Player to get move for (X or O)",
-                            "enum": ["X", "O"]
-                        },
-                        "game_over": {
-                            "type": "boolean",
-                            "description": "Whether the game has ended",
-                            "default": False
-                        },
-                        "winner": {
-                            "type": ["string", "null"],
-                            "description": "The winner of the game (X, O, or null for tie/ongoing)",
-                            "enum": ["X", "O", None]
-                        }
-                    },
-                    "required": ["board", "player"]
-                }
-            ),
-            Tool(
-                name="play_move",
-                description="Play the move at the specified position",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "board": {
-                            "type": "array",
-                            "items": {
-                                "type": ["string", "null"]
-                            },
-                            "minItems": 9,
-                            "maxItems": 9,
-                            "description": "Array representing the board state"
-                        },
-                        "position": {
-                            "type": "integer",
-                            "description": "Position to make the move (1-9)",
-                            "minimum": 1,
-                            "maximum": 9
-                        },
-                        "player": {
-                            "type": "string",
-                            "description": "Player making the move (X or O)",
-                            "enum": ["X", "O"]
-                        }
-                    },
-                    "required": ["board", "position", "player"]
-                }
-            ),
-        ]
-    
-    def get_resources(self) -> List[Resource]:
-        """Return list of available MCP resources."""
-        return [
-            Resource(
-                uri="chatttp://game-rules",
-                name="ChatTTT Game Rules",
-                description="Complete rules and gameplay mechanics for ChatTTT, including how to play, winning conditions, interface features, and available commands",
-                mimeType="text/plain"
-            ),
-            Resource(
-                uri="chatttp://strategy-guide",
-                name="ChatTTT Strategy Guide",
-                description="Advanced strategies for optimal play, including opening moves, defensive tactics, endgame scenarios, and AI learning tips",
-                mimeType="text/markdown"
-            ),
-            Resource(
-                uri="chatttp://ai-algorithms",
-                name="AI Architecture and Algorithms",
-                description="Technical details about ChatTTT's hybrid AI system, including minimax algorithm, language model integration, and MCP implementation",
-                mimeType="text/markdown"
-            ),
-            Resource(
-                uri="chatttp://commands-reference",
-                name="Natural Language Interface Guide",
-                description="Comprehensive guide to interacting with ChatTTT using natural conversation, including examples, features, and troubleshooting",
-                mimeType="text/plain"
-            )
-        ]
-    
-    async def get_resource_content(self, uri: str):
-        """Get the content of a specific resource."""
-        try:
-            if uri == "chatttp://game-rules":
-                return """# ChatTTT Game Rules
+# Resource bodies are static documentation, so they live in one
+# module-level table and get_resource_content is a dict lookup
+_RESOURCE_CONTENT = {
+    "chatttp://game-rules": """# ChatTTT Game Rules
 
 ## Objective
 Be the first player to get three of your marks (X or O) in a row, column, or diagonal.
@@ -193,10 +47,8 @@ Be the first player to get three of your marks (X or O) in a row, column, or dia
 - Provides move suggestions and strategic analysis
 - Can explain reasoning behind moves
 - Supports both optimal and random play styles
-"""
-                
-            elif uri == "chatttp://strategy-guide":
-                return """# ChatTTT Strategy Guide
+""",
+    "chatttp://strategy-guide": """# ChatTTT Strategy Guide
 
 ## Opening Strategy
 ### Best Opening Moves
@@ -245,10 +97,8 @@ The ChatTTT AI uses minimax algorithm with:
 3. **Think ahead**: Consider opponent's best responses
 4. **Learn from AI**: Use "best" command to see optimal moves
 5. **Pattern study**: Memorize common winning and drawing patterns
-"""
-                
-            elif uri == "chatttp://ai-algorithms":
-                return """# ChatTTT AI Algorithms
+""",
+    "chatttp://ai-algorithms": """# ChatTTT AI Algorithms
 
 ## Overview
 ChatTTT uses a sophisticated AI system combining multiple technologies:
@@ -404,10 +254,8 @@ def random_move(board, player, game_over, winner):
 - **Beginner Friendly**: Less intimidating than perfect play
 
 This multi-layered AI architecture makes ChatTTT both a challenging game and an educational tool for learning about game theory, AI algorithms, and natural language processing.
-"""
-                
-            elif uri == "chatttp://commands-reference":
-                return """# ChatTTT Natural Language Interface
+""",
+    "chatttp://commands-reference": """# ChatTTT Natural Language Interface
 
 ## How to Interact
 ChatTTT features an advanced natural language interface powered by AI. You don't need to memorize specific commands - just tell the AI what you want to do in natural language!
@@ -525,39 +373,193 @@ If the AI doesn't understand your input:
 - Check the resource guides for examples
 
 The AI is designed to be helpful, patient, and forgiving, so don't worry about making mistakes or asking for clarification!
-"""
-            else:
+""",
+}
+
+class MCPTools:
+    def __init__(self):
+        self.agent = TicTacToeAgent()
+        # Dispatch table: one dict lookup per call instead of walking an
+        # if/elif chain of string comparisons. The lambdas adapt the raw
+        # arguments dict to each handler's signature and are built once.
+        self._handlers = {
+            "new_game": lambda args: self._new_game(),
+            "best_move": lambda args: self._best_move(
+                args["board"],
+                args["player"],
+                args.get("game_over", False),
+                args.get("winner", None)
+            ),
+            "random_move": lambda args: self._random_move(
+                args["board"],
+                args["player"],
+                args.get("game_over", False),
+                args.get("winner", None)
+            ),
+            "play_move": lambda args: self._play_move(
+                args["board"],
+                args["position"],
+                args["player"]
+            ),
+        }
+    
+    def get_tools(self) -> List[Tool]:
+        """Return list of available MCP tools."""
+        return [
+            Tool(
+                name="new_game",
+                description="Clear the board and start a new game.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="best_move",
+                description="Get the best move for a given board state",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "board": {
+                            "type": "array",
+                            "items": {
+                                "type": ["string", "null"]
+                            },
+                            "minItems": 9,
+                            "maxItems": 9,
+                            "description": "Array representing the board state"
+                        },
+                        "player": {
+                            "type": "string",
+                            "description": "Player to get move for (X or O)",
+                            "enum": ["X", "O"]
+                        },
+                        "game_over": {
+                            "type": "boolean",
+                            "description": "Whether the game has ended",
+                            "default": False
+                        },
+                        "winner": {
+                            "type": ["string", "null"],
+                            "description": "The winner of the game (X, O, or null for tie/ongoing)",
+                            "enum": ["X", "O", None]
+                        }
+                    },
+                    "required": ["board", "player"]
+                }
+            ),
+            Tool(
+                name="random_move",
+                description="Get a random move",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "board": {
+                            "type": "array",
+                            "items": {
+                                "type": ["string", "null"]
+                            },
+                            "minItems": 9,
+                            "maxItems": 9,
+                            "description": "Array representing the board state"
+                        },
+                        "player": {
+                            "type": "string",
+                            "description": "Player to get move for (X or O)",
+                            "enum": ["X", "O"]
+                        },
+                        "game_over": {
+                            "type": "boolean",
+                            "description": "Whether the game has ended",
+                            "default": False
+                        },
+                        "winner": {
+                            "type": ["string", "null"],
+                            "description": "The winner of the game (X, O, or null for tie/ongoing)",
+                            "enum": ["X", "O", None]
+                        }
+                    },
+                    "required": ["board", "player"]
+                }
+            ),
+            Tool(
+                name="play_move",
+                description="Play the move at the specified position",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "board": {
+                            "type": "array",
+                            "items": {
+                                "type": ["string", "null"]
+                            },
+                            "minItems": 9,
+                            "maxItems": 9,
+                            "description": "Array representing the board state"
+                        },
+                        "position": {
+                            "type": "integer",
+                            "description": "Position to make the move (1-9)",
+                            "minimum": 1,
+                            "maximum": 9
+                        },
+                        "player": {
+                            "type": "string",
+                            "description": "Player making the move (X or O)",
+                            "enum": ["X", "O"]
+                        }
+                    },
+                    "required": ["board", "position", "player"]
+                }
+            ),
+        ]
+    
+    def get_resources(self) -> List[Resource]:
+        """Return list of available MCP resources."""
+        return [
+            Resource(
+                uri="chatttp://game-rules",
+                name="ChatTTT Game Rules",
+                description="Complete rules and gameplay mechanics for ChatTTT, including how to play, winning conditions, interface features, and available commands",
+                mimeType="text/plain"
+            ),
+            Resource(
+                uri="chatttp://strategy-guide",
+                name="ChatTTT Strategy Guide",
+                description="Advanced strategies for optimal play, including opening moves, defensive tactics, endgame scenarios, and AI learning tips",
+                mimeType="text/markdown"
+            ),
+            Resource(
+                uri="chatttp://ai-algorithms",
+                name="AI Architecture and Algorithms",
+                description="Technical details about ChatTTT's hybrid AI system, including minimax algorithm, language model integration, and MCP implementation",
+                mimeType="text/markdown"
+            ),
+            Resource(
+                uri="chatttp://commands-reference",
+                name="Natural Language Interface Guide",
+                description="Comprehensive guide to interacting with ChatTTT using natural conversation, including examples, features, and troubleshooting",
+                mimeType="text/plain"
+            )
+        ]
+    
+    async def get_resource_content(self, uri: str):
+        """Get the content of a specific resource."""
+        try:
+            content = _RESOURCE_CONTENT.get(uri)
+            if content is None:
                 raise ValueError(f"Unknown resource URI: {uri}")
-                
+            return content
+
         except Exception as e:
             raise Exception(f"Error reading resource {uri}: {str(e)}")
-    
+
     async def execute_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
         """Execute a tool based on its name and arguments."""
         try:
-            if name == "new_game":
-                return await self._new_game()
-            elif name == "best_move":
-                return await self._best_move(
-                    arguments["board"], 
-                    arguments["player"],
-                    arguments.get("game_over", False),
-                    arguments.get("winner", None)
-                )
-            elif name == "random_move":
-                return await self._random_move(
-                    arguments["board"], 
-                    arguments["player"],
-                    arguments.get("game_over", False),
-                    arguments.get("winner", None)
-                )
-            elif name == "play_move":
-                return await self._play_move(
-                    arguments["board"],
-                    arguments["position"],
-                    arguments["player"]
-                )
-            else:
+            handler = self._handlers.get(name)
+            if handler is None:
                 return CallToolResult(
                     content=[TextContent(
                         type="text",
@@ -565,6 +567,7 @@ The AI is designed to be helpful, patient, and forgiving, so don't worry about m
                     )],
                     isError=True
                 )
+            return await handler(arguments)
         except Exception as e:
             return CallToolResult(
                 content=[TextContent(
@@ -588,7 +591,15 @@ The AI is designed to be helpful, patient, and forgiving, so don't worry about m
     async def _best_move(self, board: List[Optional[str]], player: str, game_over: bool = False, winner: Optional[str] = None) -> CallToolResult:
         """Get the best move for the specified player."""
         best_move = self.agent.best_move(board, player, game_over, winner)
-        
+
+        if best_move == -1:
+            return CallToolResult(
+                content=[TextContent(
+                    type="text",
+                    text=f"Could not determine best move for {player}"
+                )],
+                isError=True
+            )
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -599,7 +610,15 @@ The AI is designed to be helpful, patient, and forgiving, so don't worry about m
     async def _random_move(self, board: List[Optional[str]], player: str, game_over: bool = False, winner: Optional[str] = None) -> CallToolResult:
         """Get a random move for the specified player."""
         random_move = self.agent.random_move(board, player, game_over, winner)
-        
+
+        if random_move == -1:
+            return CallToolResult(
+                content=[TextContent(
+                    type="text",
+                    text=f"Could not determine random move for {player}"
+                )],
+                isError=True
+            )
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -9,7 +9,6 @@ from mcp.server import Server
 from mcp import stdio_server
 from mcp.types import CallToolResult, TextContent
 
-from agent import TicTacToeAgent
 from mcp_tools import MCPTools
 import config
 
@@ -26,7 +25,6 @@ class TicTacToeMCPServer:
     
     def __init__(self):
         self.server = Server(config.MCP_SERVER_NAME)
-        self.agent = TicTacToeAgent()
         self.mcp_tools = MCPTools()
         self._setup_handlers()
         logger.info(f"Initialized {config.MCP_SERVER_NAME} v{config.MCP_SERVER_VERSION}")
@@ -38,25 +36,25 @@ class TicTacToeMCPServer:
         async def list_tools():
             """List available tools."""
             tools = self.mcp_tools.get_tools()
-            logger.info(f"Listed {len(tools)} available tools")
+            logger.info("Listed %d available tools", len(tools))
             return tools
         
         @self.server.list_resources()
         async def list_resources():
             """List available resources."""
             resources = self.mcp_tools.get_resources()
-            logger.info(f"Listed {len(resources)} available resources")
+            logger.info("Listed %d available resources", len(resources))
             return resources
         
         @self.server.read_resource()
         async def read_resource(uri: str):
             """Read the content of a specific resource."""
-            logger.info(f"Reading resource: {uri}")
+            logger.info("Reading resource: %s", uri)
             try:
                 content = await self.mcp_tools.get_resource_content(uri)
                 return [TextContent(type="text", text=content)]
             except Exception as e:
-                logger.error(f"Error reading resource {uri}: {e}")
+                logger.error("Error reading resource %s: %s", uri, e)
                 return [TextContent(
                     type="text", 
                     text=f"Error reading resource: {str(e)}"
@@ -65,15 +63,15 @@ class TicTacToeMCPServer:
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """Execute a tool with enhanced error handling and logging."""
-            logger.info(f"Calling tool: {name} with arguments: {arguments}")
+            logger.info("Calling tool: %s with arguments: %s", name, arguments)
             
             try:
-                # Use the enhanced tool execution with direct agent integration
-                result = await self._execute_tool_enhanced(name, arguments)
-                logger.info(f"Tool {name} executed successfully")
+                # All tool dispatch and result construction lives in MCPTools
+                result = await self.mcp_tools.execute_tool(name, arguments)
+                logger.info("Tool %s executed successfully", name)
                 return result
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}")
+                logger.error("Error executing tool %s: %s", name, e)
                 return CallToolResult(
                     content=[TextContent(
                         type="text",
@@ -82,105 +80,6 @@ class TicTacToeMCPServer:
                     isError=True
                 )
 
-    async def _execute_tool_enhanced(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
-        """Enhanced tool execution with direct AI agent integration."""
-        try:
-            if name == "new_game":
-                result = self.agent.new_game()
-                return CallToolResult(
-                    content=[TextContent(
-                        type="text",
-                        text=f"New game started: {result}"
-                    )]
-                )
-                
-            elif name == "best_move":
-                move = self.agent.best_move(
-                    arguments["board"], 
-                    arguments["player"],
-                    arguments.get("game_over", False),
-                    arguments.get("winner", None)
-                )
-                if move == -1:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Could not determine best move for {arguments['player']}"
-                        )],
-                        isError=True
-                    )
-                else:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Best move for {arguments['player']}: position {move}"
-                        )]
-                    )
-                    
-            elif name == "random_move":
-                move = self.agent.random_move(
-                    arguments["board"], 
-                    arguments["player"],
-                    arguments.get("game_over", False),
-                    arguments.get("winner", None)
-                )
-                if move == -1:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Could not determine random move for {arguments['player']}"
-                        )],
-                        isError=True
-                    )
-                else:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Random move for {arguments['player']}: position {move}"
-                        )]
-                    )
-                    
-            elif name == "play_move":
-                result = self.agent.play_move(
-                    arguments["board"],
-                    arguments["position"],
-                    arguments["player"]
-                )
-                if result == -1:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Invalid move: position {arguments['position']} for player {arguments['player']}"
-                        )],
-                        isError=True
-                    )
-                else:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Move made: player {arguments['player']} at position {result}"
-                        )]
-                    )
-                    
-            else:
-                return CallToolResult(
-                    content=[TextContent(
-                        type="text",
-                        text=f"Unknown tool: {name}"
-                    )],
-                    isError=True
-                )
-                
-        except Exception as e:
-            logger.error(f"Error in enhanced tool execution for {name}: {e}")
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Error executing tool {name}: {str(e)}"
-                )],
-                isError=True
-            )
-
     async def run(self):
         """Run the MCP server with enhanced logging."""
         logger.info("Starting ChatTTT MCP server...")